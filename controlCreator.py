@@ -1,8 +1,31 @@
 import pymel.core as pm
+import ctypes
+import hashlib
 import json
+import logging
 import os
 
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 has no read-only mapping, keep a plain dict.
+    MappingProxyType = dict
+
+try:
+    from os import scandir
+except ImportError:
+    # Python 2 needs the scandir backport.
+    from scandir import scandir
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maya import cmds
 from maya import OpenMayaUI as omui
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaUI as omui2
 
 try:
     from PySide2.QtCore import *
@@ -16,18 +39,60 @@ except ImportError:
     from PySide import __version__
     from shiboken import wrapInstance
 
+# Curves are written compact, set CC_PRETTY_JSON in the environment for indented files that are easier to read.
+_PRETTY = bool(os.environ.get('CC_PRETTY_JSON'))
+
+# Prefer orjson for reading and writing the library, fall back on the standard library json module.
+# Either way _loads takes and _dumps returns the raw bytes of the file.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if _PRETTY else 0
+
+    def _dumps(data):
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+except ImportError:
+    # Build the decoder and encoder once rather than on every call.
+    _decode = json.JSONDecoder().decode
+    if _PRETTY:
+        _encode = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=False).encode
+    else:
+        _encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+    def _loads(raw):
+        return _decode(raw.decode('utf-8'))
+
+    def _dumps(data):
+        return _encode(data).encode('utf-8')
+
+logger = logging.getLogger(__name__)
+
 # TODO Change Icon Highlight color to a more contrasting one on click
 # TODO Orthographic camera three-quarter view to better render icons.
 
-# Get the Maya window so we can parent our widget to it.
-mayaMainWindowPtr = omui.MQtUtil.mainWindow()
-mayaMainWindow = wrapInstance(long(mayaMainWindowPtr), QWidget)
+# Only resolved on first import, reloading the module keeps the previous values.
+if 'mayaMainWindow' not in globals():
+    # Get the Maya window so we can parent our widget to it.
+    mayaMainWindowPtr = omui.MQtUtil.mainWindow()
+    mayaMainWindow = wrapInstance(int(mayaMainWindowPtr), QWidget)
+
+    # Path to folder where we will keep Curves, replacing slashes to work in windows
+    save_folder = os.path.join(pm.internalVar(userAppDir=True), 'ccLibrary').replace("/", "\\")
+
+    # If the Folder doesn't exist, make dir
+    try:
+        os.makedirs(save_folder)
+    except OSError:
+        if not os.path.isdir(save_folder):
+            raise
 
-# Path to folder where we will keep Curves, replacing slashes to work in windows
-save_folder = os.path.join(pm.internalVar(userAppDir=True), 'ccLibrary').replace("/", "\\")
+# Prefix for files in the library, joined by plain concatenation.
+_SAVE = save_folder + os.sep
 
 # Maya recognized image file formats for setting the render settings image type.
-IMAGE_FILE_FORMAT = {
+# Icons no longer go through the render settings, this is kept read only for scripts that still use it.
+IMAGE_FILE_FORMAT = MappingProxyType({
   "AVI": 23,
   "Alias PIX": 6,
   "Cineon": 11,
@@ -55,11 +120,22 @@ IMAGE_FILE_FORMAT = {
   "Tiff": 3,
   "Tiff16": 4,
   "Windows Bitmap": 20
-}
+})
 
-# If the Folder doesn't exist, make dir
-if not os.path.exists(save_folder):
-    os.mkdir(save_folder)
+# Node types looked up once rather than through pymel's lazy nodetypes module on every save.
+_Transform = pm.nodetypes.Transform
+_NurbsCurve = pm.nodetypes.NurbsCurve
+
+# Curves with at least this many CVs keep their points and knots in a compressed numpy sidecar next to the json.
+_SIDECAR_MIN_CVS = 64
+
+# Key of the png text chunk holding the fingerprint of the curve an icon was taken of.
+_ICON_DIGEST = 'ccDigest'
+
+def _paths(name):
+    """ Paths to the json, png and npz sidecar files for a curve in the library. """
+    base = _SAVE + name
+    return base + '.json', base + '.png', base + '.npz'
 
 def save_curve(name, curve=None, centerPivot=True):
     """ Store information to rebuild the shape of a curve. """
@@ -68,93 +144,239 @@ def save_curve(name, curve=None, centerPivot=True):
     if not curve:
         try:
             curve = pm.selected()[0]
-        except Exception as e:
-            print e.message
+        except IndexError:
+            raise ValueError("No curve specified and nothing selected to save.")
 
     # Most likely the selection or supplied object will be the transform node and not the actual shape node that
     # we are looking for. So redefine curve variable to actually point toward the shape and not the transform.
-    if type(curve) is pm.nodetypes.Transform:
+    if isinstance(curve, _Transform):
         curve = curve.getShape()
 
     # If the shape was not a Nurbs Curve raise an error.
-    if type(curve) is not pm.nodetypes.NurbsCurve:
-        raise TypeError("{} is not of type {}".format(curve.name(), pm.nodetypes.NurbsCurve))
+    if not isinstance(curve, _NurbsCurve):
+        raise TypeError("{} is not of type {}".format(curve.name(), _NurbsCurve))
 
-    # Get all pertinent data to recreate our curve.
-    degrees = curve.degree()
-    # Can also be either Open or Closed, not sure how this effects what I am trying to do.
-    periodic = True if curve.form().key is "periodic" else False
-    cvs = [(p.x, p.y, p.z) for p in curve.getCVs()]
-    knots = curve.getKnots()
+    # Get all pertinent data to recreate our curve, read through the API function set rather than pymel wrappers.
+    selection = om2.MSelectionList()
+    selection.add(curve.longName())
+    fn = om2.MFnNurbsCurve(selection.getDagPath(0))
 
-    if centerPivot:
-        # Get average position of all points, this would be same as "center pivot"
-        center = [sum(p) / float(len(cvs)) for p in zip(*cvs)]
+    degrees = fn.degree
+    # Can also be either Open or Closed, not sure how this effects what I am trying to do.
+    periodic = fn.form == om2.MFnNurbsCurve.kPeriodic
+    points = fn.cvPositions(om2.MSpace.kObject)
+    # Knots come back as floats even when whole numbers, store those as ints so nothing needs converting on load.
+    knots = [int(k) if k == int(k) else k for k in fn.knots()]
+
+    if np is not None:
+        # Fill one array straight from the points rather than building a tuple per CV first.
+        cvs = np.fromiter(
+            (c for p in points for c in (p.x, p.y, p.z)), dtype=np.float64, count=3 * len(points)
+        ).reshape(-1, 3)
+
+        if centerPivot:
+            # Subtract the average position of all points, same as "center pivot", in one go.
+            cvs -= cvs.mean(axis=0)
+    else:
+        cvs = [(p.x, p.y, p.z) for p in points]
+
+        if centerPivot:
+            # Get average position of all points, this would be same as "center pivot"
+            sx = sy = sz = 0.0
+            for x, y, z in cvs:
+                sx += x
+                sy += y
+                sz += z
+            count = float(len(cvs))
+            cx, cy, cz = sx / count, sy / count, sz / count
+
+            # Subtract it from all point positions
+            cvs = [(x - cx, y - cy, z - cz) for x, y, z in cvs]
+
+    data = ([name, {"degree": degrees, "periodic": periodic}])
+
+    file_name, _, sidecar = _paths(name)
+    if np is not None and len(cvs) >= _SIDECAR_MIN_CVS:
+        # Large curves store their numbers as binary, the json only names the sidecar. Points centered on the pivot
+        # are fine as float32, world positions and knots keep full precision.
+        np.savez_compressed(
+            sidecar,
+            point=cvs.astype(np.float32) if centerPivot else cvs,
+            knot=np.asarray(knots, dtype=np.float64),
+        )
+        data[1]["npz"] = os.path.basename(sidecar)
+    else:
+        data[1]["point"] = cvs.tolist() if np is not None else cvs
+        data[1]["knot"] = knots
 
-        # Add inverse of new vector to all point positions
-        inverseCenter = pm.datatypes.Vector([i for i in map(lambda x: x * -1, center)])
-        cvs = [(point.x, point.y, point.z) for point in map(lambda x: inverseCenter + x, cvs)]
+        # Don't leave a sidecar behind from a previous, larger, version of this curve.
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
 
-    data = ([name, {"degree": degrees, "periodic": periodic, "point": cvs, "knot": knots}])
+    # Serialize up front so the file gets a single write instead of one per token.
+    with open(file_name, 'wb') as fp:
+        fp.write(_dumps(data))
 
-    file_name = os.path.join(save_folder, '{}.json'.format(name))
-    with open(file_name, 'w') as fp:
-        json.dump(data, fp, indent=2, sort_keys=True, ensure_ascii=False)
+    # Fingerprint of the shape, lets save_icon skip the picture when the curve hasn't changed since the last save.
+    digest = hashlib.sha1(_dumps([degrees, periodic, knots]))
+    digest.update(cvs.tobytes() if np is not None else repr(cvs).encode('utf-8'))
 
     # Save the icon
     save_icon(
         curve.listRelatives(parent=True)[0],
         name,
-        IMAGE_FILE_FORMAT['PNG']
+        digest=digest.hexdigest()
     )
 
-def save_icon(object, filename, imageFormat):
-    """ Take picture of object, render using playblast for later use as a QT Button icon. """
-    path = os.path.join(save_folder, "{}.png".format(filename))
-
-    # Store all hidden items
-    items = pm.hide(allObjects=True, returnHidden=True)
-
-    # Show only object we want to focus on and fit view
-    pm.showHidden(object)
-    pm.viewFit()
-
-    # PNG is 32 in the imageFormat enum.
-    pm.setAttr("defaultRenderGlobals.imageFormat", imageFormat)
-    pm.playblast(completeFilename=path, forceOverwrite=True, format='image', width=200, height=200,
-                 showOrnaments=False, startTime=1, endTime=1, viewer=False)
-
-    # Show all the items we hid a while back.
-    pm.showHidden(items)
+def save_icon(object, filename, imageFormat=None, digest=None):
+    """ Take picture of object, read straight from the viewport for later use as a QT Button icon. If digest is given
+    and matches the one stored in the existing icon the picture is skipped. imageFormat is ignored, icons are always
+    png, it is kept so older calls passing IMAGE_FILE_FORMAT['PNG'] keep working. """
+    path = _paths(filename)[1]
+
+    # Only reads the png header, missing files give an empty string.
+    if digest is not None and QImageReader(path).text(_ICON_DIGEST) == digest:
+        return
+
+    # Isolate the object in the active view instead of toggling visibility on every node in the scene.
+    panel = pm.playblast(activeEditor=True)
+    selection = pm.selected()
+
+    # The user may already be isolating something in this view, keep what it was to put it back after.
+    isolated = pm.isolateSelect(panel, query=True, state=True)
+    isolated_set = pm.isolateSelect(panel, query=True, viewObjects=True)
+    isolated_members = (pm.sets(isolated_set, query=True) or []) if isolated and isolated_set else []
+
+    # Playblast used to leave out the view ornaments, hide the HUD, view cube and axis for the capture as well.
+    ornaments = (
+        pm.modelEditor(panel, query=True, headsUpDisplay=True),
+        pm.viewManip(query=True, visible=True),
+        pm.toggleAxis(query=True, view=True),
+    )
 
-    # Return camera to previous view.
-    pm.viewSet(previousView=True)
+    # Keep the selection and camera changes made for the picture out of the undo queue.
+    undo_state = pm.undoInfo(query=True, state=True)
+    pm.undoInfo(stateWithoutFlush=False)
+    try:
+        pm.modelEditor(panel, edit=True, headsUpDisplay=False)
+        pm.viewManip(visible=False)
+        pm.toggleAxis(view=False)
+
+        pm.select(object)
+        pm.isolateSelect(panel, state=True)
+        # Turning isolation on when it already was doesn't pick up the selection, load it explicitly.
+        pm.isolateSelect(panel, loadSelected=True)
+        pm.viewFit()
+
+        # Grab what the active view just drew rather than going through playblast and the render settings.
+        view = omui2.M3dView.active3dView()
+        view.refresh(False, True)
+        image = om2.MImage()
+        view.readColorBuffer(image, False)
+
+        # Hand the pixels to Qt in memory, the full size capture never goes through a png on disk. Read as BGRA,
+        # the layout of RGB32 which every Qt version has and which ignores the viewport's alpha.
+        width, height = image.getSize()
+        pixels = ctypes.string_at(image.pixels(), width * height * 4)
+        frame = QImage(pixels, width, height, QImage.Format_RGB32)
+
+        # Keep a square from the middle of the view, like the old fixed size playblast. MImage rows run bottom to top.
+        side = min(width, height)
+        icon = frame.copy((width - side) // 2, (height - side) // 2, side, side).mirrored(False, True)
+
+        # Store the icon at the size the list shows it, smooth scaling keeps the thin curve lines from breaking up.
+        icon = icon.scaled(96, 96, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        if digest is not None:
+            icon.setText(_ICON_DIGEST, digest)
+        # For png Qt turns quality into the zlib level the other way round, 0 is the strongest compression. Icons are
+        # small, the extra effort is cheap and they take less disk and read faster.
+        icon.save(path, 'PNG', 0)
+    finally:
+        # Put the view back even if the picture failed. Nothing needs drawing meanwhile, hold redraws until it
+        # is done and refresh once.
+        pm.refresh(suspend=True)
+        try:
+            # Bring back what the user had isolated, or the rest of the scene, and what the user had selected.
+            if isolated:
+                pm.select(isolated_members)
+                pm.isolateSelect(panel, loadSelected=True)
+            else:
+                pm.isolateSelect(panel, state=False)
+            pm.select(selection)
+
+            # Return camera to previous view.
+            pm.viewSet(previousView=True)
+
+            pm.modelEditor(panel, edit=True, headsUpDisplay=ornaments[0])
+            pm.viewManip(visible=ornaments[1])
+            pm.toggleAxis(view=ornaments[2])
+        finally:
+            pm.refresh(suspend=False)
+            pm.undoInfo(stateWithoutFlush=undo_state)
+        pm.refresh(force=True)
 
 def load_curve(file_name):
     """ Load a saved curve from disk. """
-    file_path = os.path.join(save_folder, file_name)
+    file_path = _SAVE + file_name
     if not os.path.exists(file_path):
         raise IOError("File {} does not exist in {}".format(file_name, save_folder))
 
-    with open(file_path, 'r') as fp:
-        data = json.load(fp)
+    return _read_curve(file_path)
+
+def _stamp(entry, sidecar=None):
+    """ What identifies a version of a library file, modification time and size of the json and of its sidecar entry
+    if there is one. A sidecar curve's json is the same bytes for any shape, so the sidecar has to be part of it. """
+    stat = entry.stat()
+    if sidecar is None:
+        return stat.st_mtime, stat.st_size
+    sidecar_stat = sidecar.stat()
+    return stat.st_mtime, stat.st_size, sidecar_stat.st_mtime, sidecar_stat.st_size
+
+def _read_curve(file_path):
+    """ Read curve data from a path already known to exist. """
+    with open(file_path, 'rb') as fp:
+        data = _loads(fp.read())
+
+    # Points and knots of large curves are in a sidecar next to the json.
+    params = data[1]
+    if "npz" in params:
+        if np is None:
+            raise IOError("{} keeps its points in {}, loading it requires numpy".format(file_path, params["npz"]))
+
+        with np.load(os.path.join(os.path.dirname(file_path), params.pop("npz"))) as arrays:
+            params["point"] = arrays["point"].tolist()
+            params["knot"] = arrays["knot"].tolist()
 
     return data
 
-def parse(data):
-    """ Parse the json data and write the command that we're going to run, used to have this for actual functionality
-     but calling eval(command) isn't the most clever thing to do. """
-    try:
-        degrees = "d={}".format(data["degree"])
-        periodic = "periodic={}".format(data["periodic"])
-        points = 'p={}'.format([tuple(p) for p in data["point"]])
-        knots = 'k={}'.format([int(k) for k in data["knot"]])
+class CurveParams(object):
+    """ Arguments to recreate a saved curve, one small fixed record per curve instead of a dict. """
+    __slots__ = ('degree', 'periodic', 'point', 'knot')
+
+    def __init__(self, degree, periodic, point, knot):
+        self.degree = degree
+        self.periodic = periodic
+        self.point = point
+        self.knot = knot
 
-        # String of the pymel command to recreate saved curve.
-        return "pm.curve({})".format(', '.join([degrees, periodic, points, knots]))
+    def create(self):
+        """ Make the curve, returns the name of its transform. """
+        return cmds.curve(degree=self.degree, periodic=self.periodic, point=self.point, knot=self.knot)
 
-    except Exception as e:
-        print e.message
+# Parsed curves shared between library reloads, keyed by path and stored along with the (mtime, size) they were read at.
+_curves = {}
+
+# Decoded icons live in Qt's pixmap cache keyed by path, shared between items and reloads but bounded in size.
+QPixmapCache.setCacheLimit(20480)
+
+def _icon(path):
+    """ Get the icon for path, decoding the image only when it isn't in the pixmap cache already. """
+    pixmap = QPixmap()
+    if not QPixmapCache.find(path, pixmap):
+        # Don't hold on to a missing image, it may just not have been written yet.
+        if pixmap.load(path):
+            QPixmapCache.insert(path, pixmap)
+    return QIcon(pixmap)
 
 # Dictionary to convert the radio buttons Ids to directions
 DIRECTIONS = {0: 'X', 1: 'Y', 2: 'Z'}
@@ -165,19 +387,19 @@ def change_direction(transform, direction):
     when one can just alter the rotation after creation and prior to moving it to target object. """
 
     # If X up we want to rotate 90 deg around the Z axis,
-    if direction is 'X':
-        transform.setAttr('rotateZ', 90)
-        pm.makeIdentity(transform, apply=True, rotate=True)
+    if direction == 'X':
+        cmds.setAttr('{}.rotateZ'.format(transform), 90)
+        cmds.makeIdentity(transform, apply=True, rotate=True)
     # and for Z up we rotate 90 deg around the X axis.
-    elif direction is 'Z':
-        transform.setAttr('rotateX', 90)
-        pm.makeIdentity(transform, apply=True, rotate=True)
+    elif direction == 'Z':
+        cmds.setAttr('{}.rotateX'.format(transform), 90)
+        cmds.makeIdentity(transform, apply=True, rotate=True)
 
 class Window(QWidget):
     def __init__(self, parent=mayaMainWindow):
         super(Window, self).__init__(parent=parent)
 
-        if os.name is 'posix':
+        if os.name == 'posix':
             self.setWindowFlags(Qt.Tool)
         else:
             self.setWindowFlags(Qt.Window)
@@ -275,8 +497,8 @@ class Window(QWidget):
             centerPivot=self.save_center_pivot.isChecked()
         )
 
-        # Reload the library on saves.
-        self.listWidget.load_library()
+        # Pick up the saved curve without reloading the whole library.
+        self.listWidget.refresh()
 
 class RequiredLineEdit(QLineEdit):
     def __init__(self, text, button):
@@ -292,10 +514,13 @@ class RequiredLineEdit(QLineEdit):
         else:
             self.button.setEnabled(True)
 
-class CurveList(QListWidget):
+class CurveList(QListView):
     def __init__(self):
         super(CurveList, self).__init__()
-        self.itemClicked.connect(self.createCurve)
+        self.clicked.connect(self.createCurve)
+
+        # Items are only clicked to create curves, never renamed in place.
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
         # Set and create connections for custom context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -311,6 +536,19 @@ class CurveList(QListWidget):
         # Set resize mode for our list view to adjust layout
         self.setResizeMode(QListView.ResizeMode.Adjust)
 
+        # All items share the grid size, saves Qt from measuring each one.
+        self.setUniformItemSizes(True)
+
+        # Follow changes to the save folder, only the files that changed get their items updated. A save writes
+        # several files, so wait for the burst of change notifications to settle and refresh once.
+        self._refreshTimer = QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(100)
+        self._refreshTimer.timeout.connect(self.refresh)
+
+        self._watcher = QFileSystemWatcher([save_folder], self)
+        self._watcher.directoryChanged.connect(lambda path: self._refreshTimer.start())
+
         """ Think in order to solve the QIcon highlighting issue I will have to look into QItemDelegates and 
         make a custom one. """
 
@@ -330,79 +568,157 @@ class CurveList(QListWidget):
         menu.exec_(position)
 
     def load_library(self):
-        """ Clear widget of items, and fill with all items in save folder. """
-
-        # Clear the widget
-        self.clear()
-
-        # Get all files in our folder, then sort out all our jsons to library list, and png icons to theirs.
-        files = os.listdir(save_folder)
-        library = [f for f in files if f.endswith("json")]
-
-        for f in library:
-            data = load_curve(f)
-            iconPath = os.path.join(save_folder, "{}.png".format(data[0]))
-            self.addItem(CurveItem(data[0], data[1], QIcon(iconPath), None))
+        """ Replace the items in the widget with all items in save folder. """
+
+        # Fill a new model before handing it to the view, so the view only updates once at the end.
+        model = QStandardItemModel(self)
+        model.invisibleRootItem().appendRows([self._createItem(*files) for files in self._scan()])
+
+        # setModel leaves the old model and its selection model behind, get rid of both.
+        previous = self.model()
+        previous_selection = self.selectionModel()
+        self.setModel(model)
+        if previous is not None:
+            previous.deleteLater()
+            previous_selection.deleteLater()
+
+    def refresh(self):
+        """ Bring the widget in line with the save folder, only touching items added, removed or changed. """
+        model = self.model()
+        if model is None:
+            return self.load_library()
+
+        library = {files[0].name[:-5]: files for files in self._scan()}
+
+        for row in reversed(range(model.rowCount())):
+            item = model.item(row)
+            files = library.pop(item.name, None)
+            if files is not None and _stamp(*files) == item.stamp:
+                continue
+
+            # Removed or overwritten, drop the item along with the icon and parsed curve we held for it.
+            QPixmapCache.remove(item.icon_path)
+            _curves.pop(item.file_path, None)
+            model.removeRow(row)
+            if files is not None:
+                model.insertRow(row, self._createItem(*files))
+
+        # New curves go in as one batch, a single insert for the view to handle.
+        if library:
+            model.invisibleRootItem().appendRows([self._createItem(*files) for files in library.values()])
+
+    def _scan(self):
+        """ Single pass over the folder, entries come with their full path so there is no need to rebuild it. Gives
+        a (json, sidecar) pair of entries per curve, the sidecar is None for curves that have none. """
+        curves = []
+        sidecars = {}
+        for entry in scandir(save_folder):
+            if entry.name.endswith(".json") and entry.is_file():
+                curves.append(entry)
+            elif entry.name.endswith(".npz") and entry.is_file():
+                sidecars[entry.name[:-4]] = entry
+        return [(entry, sidecars.get(entry.name[:-5])) for entry in curves]
+
+    def _createItem(self, entry, sidecar=None):
+        """ Items only keep the paths, curve data and icon get read when first needed. """
+        # Icon sits next to the json, just swap the extension.
+        iconPath = entry.path[:-4] + "png"
+        return CurveItem(entry.name[:-5], entry.path, iconPath, _stamp(entry, sidecar))
 
     def deleteItem(self):
         """ Remove files for selected items. """
 
-        for item in self.selectedItems():
-            data_file = os.path.join(save_folder, '{}.json'.format(item.name))
-            icon_file = os.path.join(save_folder, '{}.png'.format(item.name))
+        model = self.model()
+        for item in [model.itemFromIndex(index) for index in self.selectedIndexes()]:
+            logger.info("Removing {0}.json and {0}.png in folder {1}".format(item.name, save_folder))
 
-            print("Removing {0}.json and {0}.png in folder {1}".format(item.name, save_folder))
-
-            os.remove(data_file)
-            os.remove(icon_file)
+            # Best effort, a file that is already gone shouldn't keep the others around.
+            for path in _paths(item.name):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
 
         # Refresh items.
-        self.load_library()
+        self.refresh()
 
-    def createCurve(self, item):
-        """ Make a pymel call to curve with the stored params. """
-        selection = pm.selected()
+    def createCurve(self, index):
+        """ Make a call to curve with the stored params, through maya.cmds to skip the pymel wrapping. """
+        item = self.model().itemFromIndex(index)
+        selection = cmds.ls(selection=True, long=True)
         if selection:
             for selected in selection:
-                curve = pm.curve(**item.params)
+                curve = item.params.create()
 
                 # Rotate the curve to fit better.
                 up_direction = self.parentWidget().ctrl_normal.checkedId()
                 change_direction(curve, DIRECTIONS[up_direction])
 
                 # Match Transforms, can also be done using parenting with relative flag set.
-                pm.xform(
+                cmds.xform(
                     curve,
                     ws=True,
-                    translation=pm.xform(selected, q=True, ws=True, t=True),
-                    rotation=pm.xform(selected, q=True, ws=True, ro=True),
+                    translation=cmds.xform(selected, q=True, ws=True, t=True),
+                    rotation=cmds.xform(selected, q=True, ws=True, ro=True),
                 )
 
-                # Match Names,
-                pm.rename(curve, selected.nodeName() + '_CTRL')
+                # Match Names. cmds hands back short names that are only unique among siblings, so follow the nodes
+                # by uuid and look up their full path after each rename or parent.
+                name = selected.rsplit('|', 1)[-1] + '_CTRL'
+                curve_id = cmds.ls(curve, uuid=True)[0]
+                cmds.rename(curve, name)
 
                 # If Offset group in parent is checked, add an offset group to zero out transforms for controller.
                 if self.parentWidget().offset_transform.isChecked():
-                    offset_grp = pm.group(empty=True, name='{}_Offset'.format(curve.nodeName()))
+                    offset_id = cmds.ls(cmds.group(empty=True), uuid=True)[0]
+                    cmds.rename(cmds.ls(offset_id, long=True)[0], '{}_Offset'.format(name))
 
                     # Move the group to selected and set curve as child.
-                    pm.parent(offset_grp, selected, relative=True)
-                    pm.parent(offset_grp, world=True)
-                    pm.parent(curve, offset_grp)
+                    cmds.parent(cmds.ls(offset_id, long=True)[0], selected, relative=True)
+                    cmds.parent(cmds.ls(offset_id, long=True)[0], world=True)
+                    cmds.parent(cmds.ls(curve_id, long=True)[0], cmds.ls(offset_id, long=True)[0])
 
                     # Freeze transform to zero out transforms on curve.
-                    pm.makeIdentity(curve, apply=True, translate=True, rotate=True, s=True)
+                    cmds.makeIdentity(
+                        cmds.ls(curve_id, long=True)[0], apply=True, translate=True, rotate=True, scale=True
+                    )
         else:
-            pm.curve(**item.params)
+            item.params.create()
 
-class CurveItem(QListWidgetItem):
-    def __init__(self, name, params, *args):
+class CurveItem(QStandardItem):
+    def __init__(self, name, file_path, icon_path, stamp, *args):
         super(CurveItem, self).__init__(*args)
-        # JSON parses the data as unicode which apparently pymel had issues parsing to MEL
-        self.params = {str(k): v for k, v in params.iteritems()}
         self.name = name
-
-        self.setToolTip(self.name)
+        self.file_path = file_path
+        self.icon_path = icon_path
+        self.stamp = stamp
+
+        self._params = None
+
+    @property
+    def params(self):
+        """ Curve data, read from disk the first time the item is used unless the file is unchanged since last read. """
+        if self._params is None:
+            cached = _curves.get(self.file_path)
+            if cached is not None and cached[0] == self.stamp:
+                params = cached[1]
+            else:
+                data = _read_curve(self.file_path)[1]
+                # Points as the (x, y, z) tuples curve expects, done once here instead of on every click.
+                params = CurveParams(
+                    data['degree'], data['periodic'], [tuple(p) for p in data['point']], data['knot']
+                )
+                _curves[self.file_path] = (self.stamp, params)
+            self._params = params
+        return self._params
+
+    def data(self, role=Qt.UserRole + 1):
+        # Tooltip and icon are answered on request instead of being stored on every item up front.
+        if role == Qt.ToolTipRole:
+            return self.name
+        if role == Qt.DecorationRole:
+            return _icon(self.icon_path)
+        return super(CurveItem, self).data(role)
 
 def getUI():
     window = Window()